@@ -4,17 +4,160 @@ Streamlit web application for automated company research and agreement landscape
 """
 import streamlit as st
 import asyncio
+import base64
+import functools
+import gzip
+import hashlib
 import json
+import logging
 import os
+import re
+import time
+import zipfile
+from io import BytesIO
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from research_agent import CompanyResearchAgent
-from export_manager import ExportManager
 from supabase_storage import SupabaseStorageManager
-from dotenv import load_dotenv
+
+# research_agent (openai/tavily) and export_manager (playwright/pptx/docx)
+# are imported lazily at their use sites to keep cold-start imports light
+
+# Use uvloop for the research fan-out when available (2-4x lower event loop
+# overhead than the default selector loop); fall back silently otherwise
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson serializes large nested dicts several times faster than stdlib
+# json; ujson (plain C, builds where orjson's Rust wheel won't) is the
+# middle tier so locked-down deployments still skip the stdlib encoder
+ujson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+
+logger = logging.getLogger(__name__)
+
+# Shared read-only default for .get(..., {}) chains: reusing one dict avoids
+# allocating a throwaway empty literal at every nested access. Callers must
+# never mutate it.
+_EMPTY: dict = {}
+
+# pandas is ~300ms of cold import; loaded on first table render and then
+# served from this module global (one attribute load on the hot path,
+# versus re-running the import statement's sys.modules machinery per call)
+_pandas = None
+
+
+def _pd():
+    """Return the pandas module, importing it on first use"""
+    global _pandas
+    if _pandas is None:
+        import pandas
+        _pandas = pandas
+    return _pandas
+
+
+def _run_async(coro):
+    """Run a coroutine on the session's persistent event loop
+
+    asyncio.run builds and tears down a fresh loop (policy resolution,
+    selector setup) on every call. Keeping one loop per session in
+    st.session_state skips that bootstrap and lets async HTTP clients
+    keep pooled connections alive between research runs.
+    """
+    loop = st.session_state.get('_event_loop')
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state._event_loop = loop
+    return loop.run_until_complete(coro)
+
+
+def _debug_enabled() -> bool:
+    """Full tracebacks render in the page only when loaded with ?debug=1
+
+    The server log always gets the exception; st.exception formats and
+    ships the whole traceback to the frontend, which is developer noise
+    for end users and a needless string build on every failure.
+    """
+    try:
+        return st.query_params.get("debug") == "1"
+    except Exception:
+        return False
+
+
+def _jsonize(obj):
+    """Last-resort serializer for types orjson has no native encoding for"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+# numpy scalars, datetimes and non-str dict keys are encoded natively in C
+# instead of round-tripping through a per-value Python default= callback
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes via the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS, default=_jsonize)
+    if ujson is not None:
+        return ujson.dumps(obj, default=_jsonize).encode('utf-8')
+    return json.dumps(obj, default=_jsonize).encode('utf-8')
+
+def _json_dumps_pretty_bytes(obj) -> bytes:
+    """Serialize to indented JSON bytes for user-facing downloads"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS | orjson.OPT_INDENT_2, default=_jsonize)
+    if ujson is not None:
+        return ujson.dumps(obj, indent=2, default=_jsonize).encode('utf-8')
+    return json.dumps(obj, indent=2, default=_jsonize).encode('utf-8')
+
+def _analysis_hash(analysis: dict) -> str:
+    """Stable content hash of an analysis dict, used as a cache key"""
+    return hashlib.blake2b(_json_dumps_bytes(analysis), digest_size=16).hexdigest()
+
+@st.cache_data
+def _serialized_pretty_json(analysis_hash: str, _analysis: dict) -> bytes:
+    """Pretty JSON bytes for download, memoized on the analysis content hash
+
+    Keying on the hash (the underscore-prefixed dict is excluded from the
+    key) makes repeated export clicks a dictionary lookup instead of
+    re-serializing a multi-MB dict on every rerun.
+    """
+    return _json_dumps_pretty_bytes(_analysis)
+
+@st.cache_data
+def _serialized_json_gz(analysis_hash: str, _analysis: dict) -> bytes:
+    """Gzipped JSON bytes for download, memoized on the analysis content hash
+
+    compresslevel=3 sits near the throughput/size knee (3-8x smaller for
+    <10ms of CPU); mtime=0 keeps the output deterministic per analysis.
+    Compact form: indentation would only add bytes for gzip to chew
+    through — pretty-printing is reserved for the plain .json download.
+    """
+    return gzip.compress(_json_dumps_bytes(_analysis), compresslevel=3, mtime=0)
+
+@st.cache_resource
+def _env_loaded() -> bool:
+    """Parse the .env file once per process instead of on every rerun"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
+
 
 # Load environment variables from .env file
-load_dotenv()
+_env_loaded()
 
 # Page configuration
 st.set_page_config(
@@ -24,8 +167,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Font Awesome CDN and Custom CSS
-st.markdown("""
+# Font Awesome CDN and Custom CSS (built once at import; injected via cached helper)
+_CSS_BLOB = """
 <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
 <style>
     .main-header {
@@ -68,6 +211,25 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
         border-left: 4px solid #667eea;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+        margin: 0.5rem 0;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+        padding: 1rem;
+    }
+    .metric-row .metric-label {
+        font-size: 0.8rem;
+        color: #718096;
+        margin-bottom: 0.25rem;
+    }
+    .metric-row .metric-value {
+        font-size: 1.5rem;
+        font-weight: 600;
+        color: #2d3748;
+    }
     .stProgress > div > div > div > div {
         background-color: #667eea;
     }
@@ -122,7 +284,48 @@ st.markdown("""
         50% { opacity: 0.7; }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Style overrides for secondary buttons on the results page
+_BUTTON_STYLE_BLOB = """
+<style>
+button[kind="secondary"] p {
+    text-transform: none !important;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif !important;
+}
+</style>
+"""
+
+
+# Static sidebar copy, built once at import so every rerun ships the same
+# string (the frontend caches rendered Markdown by content hash)
+_ABOUT_BLOB = """
+### <i class="fas fa-info-circle"></i> About & Features
+
+This tool uses AI to research companies and generate comprehensive agreement landscape analyses.
+
+**Features:**
+- Parallel research agents (4x faster)
+- Company profile analysis
+- Business unit breakdown
+- Agreement landscape mapping
+- Optimization opportunities
+- Interactive visualization
+- Web search via Tavily (optional)
+- Save to Supabase (optional)
+"""
+
+
+@st.cache_resource
+def _inject_css():
+    """Send the static CSS/Font Awesome blob to the frontend once per session"""
+    st.markdown(_CSS_BLOB, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _inject_button_style():
+    """Send the secondary-button style overrides to the frontend once per session"""
+    st.markdown(_BUTTON_STYLE_BLOB, unsafe_allow_html=True)
 
 
 def init_session_state():
@@ -133,157 +336,253 @@ def init_session_state():
         st.session_state.research_status = {}
 
 
-def render_research_status(task_name: str, title: str, icon: str, state: str = 'not-started', message: str = ''):
-    """Render a research status indicator"""
-    icon_map = {
-        'not-started': '<i class="fas fa-circle" style="color: #cbd5e0;"></i>',
-        'in-progress': '<i class="fas fa-spinner fa-pulse" style="color: #f6ad55;"></i>',
-        'completed': '<i class="fas fa-check-circle" style="color: #38a169;"></i>'
-    }
+# Status icons per research state
+_ICON_MAP = {
+    'not-started': '<i class="fas fa-circle" style="color: #cbd5e0;"></i>',
+    'in-progress': '<i class="fas fa-spinner fa-pulse" style="color: #f6ad55;"></i>',
+    'completed': '<i class="fas fa-check-circle" style="color: #38a169;"></i>'
+}
+
+# Research tasks shown in the progress UI (key, title, icon)
+_RESEARCH_TASKS = (
+    ('profile', 'Company Profile', 'fas fa-building'),
+    ('business_units', 'Business Units', 'fas fa-industry'),
+    ('priorities', 'Strategic Priorities', 'fas fa-bullseye'),
+    ('landscape', 'Agreement Landscape', 'fas fa-chart-bar'),
+    ('deep_research', 'Deep Research', 'fas fa-search'),
+    ('opportunities', 'Opportunities', 'fas fa-lightbulb'),
+    ('matrix', 'Agreement Matrix', 'fas fa-table')
+)
 
-    status_icon = icon_map.get(state, '<i class="fas fa-circle" style="color: #cbd5e0;"></i>')
-    message_html = f'<span class="research-status-message">- {message}</span>' if message else ''
 
+def _build_status_template(title: str, state: str) -> str:
+    """Build a status indicator template with only the message left to fill in"""
+    status_icon = _ICON_MAP.get(state, _ICON_MAP['not-started'])
     return f"""
     <div class="research-status {state}">
         <span class="research-status-icon">{status_icon}</span>
         <span class="research-status-title">{title}</span>
-        {message_html}
+        {{message}}
     </div>
     """
 
 
-def create_progress_callback(task_name: str, placeholder, title: str, icon: str):
-    """Create a progress callback function for a specific task"""
-    def callback(message: str):
+# Pre-rendered status variants keyed by (task_name, state), so per-tick
+# rendering is a dict lookup + one .format() instead of full f-string assembly
+_STATUS_TEMPLATES = {
+    (key, state): _build_status_template(title, state)
+    for key, title, _icon in _RESEARCH_TASKS
+    for state in _ICON_MAP
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def render_research_status(task_name: str, title: str, icon: str, state: str = 'not-started', message: str = ''):
+    """Render a research status indicator
+
+    Pure function of its (hashable) arguments; repeated identical-state
+    renders across board repaints become a cache lookup.
+    """
+    message_html = f'<span class="research-status-message">- {message}</span>' if message else ''
+
+    template = _STATUS_TEMPLATES.get((task_name, state))
+    if template is None:
+        template = _build_status_template(title, state)
+
+    return template.format(message=message_html)
+
+
+# Minimum interval between placeholder updates per task (seconds). Agents can
+# stream many status messages per second; anything faster than ~one frame is
+# invisible to the user and just floods the websocket.
+_PROGRESS_FLUSH_INTERVAL = 0.05
+
+
+def _render_progress_columns(progress_boxes):
+    """Repaint the whole progress board from session state
+
+    st.session_state.research_progress is the source of truth; each column
+    is composed into one HTML string and pushed as a single element, so a
+    tick updates two elements instead of one per task.
+    """
+    progress = st.session_state.get('research_progress', _EMPTY)
+    columns = ([], [])
+    for i, (key, title, icon) in enumerate(_RESEARCH_TASKS):
+        entry = progress.get(key)
+        if entry:
+            html = render_research_status(key, title, icon, entry['state'], entry['message'])
+        else:
+            html = render_research_status(key, title, icon)
+        columns[i % 2].append(html)
+
+    progress_boxes[0].html("".join(columns[0]))
+    progress_boxes[1].html("".join(columns[1]))
+
+
+@st.fragment
+def _progress_region():
+    """Build the progress board inside its own fragment
+
+    Scoping the board to a fragment keeps any rerun originating here from
+    replaying the rest of the page. run_every polling is deliberately not
+    used: the research coroutine blocks the script thread, so a timer
+    fragment could not tick mid-run anyway — the debounced callbacks paint
+    the placeholders directly instead.
+    """
+    col1, col2 = st.columns(2)
+
+    # One placeholder per column; each tick repaints a whole column at once
+    progress_boxes = (col1.empty(), col2.empty())
+    _render_progress_columns(progress_boxes)
+    return progress_boxes
+
+
+def create_progress_callback(task_name: str, progress_boxes):
+    """Create a progress callback function for a specific task
+
+    Updates are coalesced: intermediate messages arriving faster than
+    _PROGRESS_FLUSH_INTERVAL are dropped, but 'completed' states and the
+    final pending repaint (via callback.flush()) are always rendered.
+    """
+    last_flush = [0.0]
+    dirty = [False]
+
+    def callback(message: str, state: str = None):
         # Update session state
         if 'research_progress' not in st.session_state:
             st.session_state.research_progress = {}
 
-        # Determine state from message
-        if 'complete' in message.lower() or 'done' in message.lower():
-            state = 'completed'
-        else:
-            state = 'in-progress'
+        # Determine state from message unless the caller said explicitly.
+        # The agent prefixes every terminal status with "[✓]", which is
+        # cheap to check and doesn't depend on where the word "complete"
+        # lands in the message (token-usage tails pushed it past the old
+        # fixed-width sniff window for longer task names)
+        if state is None:
+            state = 'completed' if message.startswith('[✓]') else 'in-progress'
 
         st.session_state.research_progress[task_name] = {
             'state': state,
             'message': message
         }
 
-        # Update the placeholder with new status
-        placeholder.markdown(
-            render_research_status(task_name, title, icon, state, message),
-            unsafe_allow_html=True
-        )
+        dirty[0] = True
+
+        # Flush at most once per interval; completion always flushes
+        now = time.monotonic()
+        if state == 'completed' or now - last_flush[0] > _PROGRESS_FLUSH_INTERVAL:
+            _render_progress_columns(progress_boxes)
+            last_flush[0] = now
+            dirty[0] = False
+
+    def flush():
+        """Repaint if an update was coalesced away"""
+        if dirty[0]:
+            _render_progress_columns(progress_boxes)
+            dirty[0] = False
+
+    callback.flush = flush
     return callback
 
 
-async def run_research(company_name: str, api_key: str, tavily_key: str, progress_containers: dict, status_obj):
-    """Execute the research asynchronously with progress tracking"""
+@st.cache_resource
+def _get_agent(api_key: str, tavily_key: str) -> "CompanyResearchAgent":
+    """Build the research agent once per (api_key, tavily_key) pair
 
-    agent = CompanyResearchAgent(api_key=api_key, tavily_api_key=tavily_key)
+    Keeps the OpenAI client (and its pooled HTTPS connections) alive
+    across analyses instead of re-initializing it on every click.
+    """
+    from research_agent import CompanyResearchAgent
+    return CompanyResearchAgent(api_key=api_key, tavily_api_key=tavily_key)
 
-    # Define research categories with metadata
-    research_categories = {
-        'profile': {'title': 'Company Profile', 'icon': 'fas fa-building'},
-        'business_units': {'title': 'Business Units', 'icon': 'fas fa-industry'},
-        'priorities': {'title': 'Strategic Priorities', 'icon': 'fas fa-bullseye'},
-        'landscape': {'title': 'Agreement Landscape', 'icon': 'fas fa-chart-bar'},
-        'opportunities': {'title': 'Opportunities', 'icon': 'fas fa-lightbulb'},
-        'matrix': {'title': 'Agreement Matrix', 'icon': 'fas fa-table'}
-    }
 
-    # Create progress callbacks with titles and icons
+@st.cache_resource
+def _get_export_manager() -> "ExportManager":
+    """Share a single ExportManager across export clicks
+
+    Keeps any expensive backend state (e.g. a warm Playwright browser)
+    alive for the life of the server process.
+    """
+    from export_manager import ExportManager
+    return ExportManager(persistent=True)
+
+
+async def run_research(company_name: str, api_key: str, tavily_key: str, progress_boxes, status_obj):
+    """Execute the research asynchronously with progress tracking"""
+
+    agent = _get_agent(api_key, tavily_key)
+
+    # Create progress callbacks from the shared task metadata
     callbacks = {
-        task: create_progress_callback(
-            task,
-            progress_containers[task],
-            research_categories[task]['title'],
-            research_categories[task]['icon']
-        )
-        for task in research_categories
+        key: create_progress_callback(key, progress_boxes)
+        for key, _title, _icon in _RESEARCH_TASKS
     }
 
     # Run research
     result = await agent.research_company_full(company_name, callbacks, status_obj)
 
+    # Drain any progress messages the debounce held back
+    for callback in callbacks.values():
+        callback.flush()
+
     return result
 
 
-def display_analysis_summary(analysis: dict):
-    """Display summary metrics from analysis"""
+def _fmt_int(v, default='N/A'):
+    """Format an int with thousands separators; pass other values through"""
+    if isinstance(v, int):
+        return f"{v:,}"
+    return v if v is not None else default
 
-    profile = analysis.get('company_profile', {})
-    scale = profile.get('scale', {})
-    portfolio = analysis.get('portfolio_summary', {})
-    landscape = analysis.get('agreement_landscape_by_function', {})
-
-    st.markdown('### <i class="fas fa-chart-line" style="color: rgb(255, 75, 75);"></i> Analysis Summary', unsafe_allow_html=True)
 
-    col1, col2, col3, col4, col5 = st.columns(5)
+def _metric_row_html(metrics) -> str:
+    """Build a row of (label, value) metric cards as an HTML string"""
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div></div>'
+        for label, value in metrics
+    )
+    return f'<div class="metric-row">{cards}</div>'
 
-    with col1:
-        st.metric(
-            label="Annual Revenue",
-            value=scale.get('annual_revenue', 'N/A')
-        )
 
-    with col2:
-        st.metric(
-            label="Employees",
-            value=f"{scale.get('employees', 'N/A'):,}" if isinstance(scale.get('employees'), int) else scale.get('employees', 'N/A')
-        )
+def _metric_row(metrics):
+    """Render a row of (label, value) metric cards as a single element
 
-    with col3:
-        st.metric(
-            label="Business Units",
-            value=len(analysis.get('business_units', []))
-        )
+    One st.html call ships one element to the frontend, versus one
+    protobuf element per st.metric.
+    """
+    st.html(_metric_row_html(metrics))
 
-    with col4:
-        # Show function count from new landscape structure
-        functions = landscape.get('functions', [])
-        st.metric(
-            label="Business Functions",
-            value=len(functions) if functions else 0
-        )
 
-    with col5:
-        st.metric(
-            label="Opportunities",
-            value=portfolio.get('total_opportunities', 0)
-        )
+def display_analysis_summary(analysis: dict):
+    """Display summary metrics from analysis"""
 
-    # Portfolio value metrics
-    if portfolio.get('total_opportunities', 0) > 0:
-        st.markdown('### <i class="fas fa-dollar-sign" style="color: rgb(255, 75, 75);"></i> Optimization Portfolio', unsafe_allow_html=True)
+    profile = analysis.get('company_profile', _EMPTY)
+    scale = profile.get('scale', _EMPTY)
+    portfolio = analysis.get('portfolio_summary', _EMPTY)
+    landscape = analysis.get('agreement_landscape_by_function', _EMPTY)
 
-        col1, col2, col3, col4 = st.columns(4)
+    st.markdown('### <i class="fas fa-chart-line" style="color: rgb(255, 75, 75);"></i> Analysis Summary', unsafe_allow_html=True)
 
-        with col1:
-            st.metric(
-                label="Total Annual Value",
-                value=portfolio.get('total_annual_value', 'N/A')
-            )
+    functions = landscape.get('functions', [])
 
-        with col2:
-            st.metric(
-                label="Implementation Cost",
-                value=portfolio.get('total_implementation_cost', 'N/A')
-            )
+    _metric_row([
+        ("Annual Revenue", scale.get('annual_revenue', 'N/A')),
+        ("Employees", _fmt_int(scale.get('employees', 'N/A'))),
+        ("Business Units", len(analysis.get('business_units', []))),
+        ("Business Functions", len(functions) if functions else 0),
+        ("Opportunities", portfolio.get('total_opportunities', 0))
+    ])
 
-        with col3:
-            st.metric(
-                label="Portfolio ROI",
-                value=portfolio.get('portfolio_roi', 'N/A')
-            )
+    # Portfolio value metrics
+    if portfolio.get('total_opportunities', 0) > 0:
+        st.markdown('### <i class="fas fa-dollar-sign" style="color: rgb(255, 75, 75);"></i> Optimization Portfolio', unsafe_allow_html=True)
 
-        with col4:
-            st.metric(
-                label="Payback Period",
-                value=portfolio.get('portfolio_payback', 'N/A')
-            )
+        _metric_row([
+            ("Total Annual Value", portfolio.get('total_annual_value', 'N/A')),
+            ("Implementation Cost", portfolio.get('total_implementation_cost', 'N/A')),
+            ("Portfolio ROI", portfolio.get('portfolio_roi', 'N/A')),
+            ("Payback Period", portfolio.get('portfolio_payback', 'N/A'))
+        ])
 
 
 def display_company_profile(profile: dict):
@@ -301,7 +600,7 @@ def display_company_profile(profile: dict):
             st.markdown(f"**Ownership:** {profile.get('ownership_structure', 'N/A')}")
 
         with col2:
-            scale = profile.get('scale', {})
+            scale = profile.get('scale', _EMPTY)
             st.markdown(f"**Revenue:** {scale.get('annual_revenue', 'N/A')}")
             st.markdown(f"**Employees:** {scale.get('employees', 'N/A')}")
             st.markdown(f"**Locations:** {scale.get('locations', 'N/A')}")
@@ -309,7 +608,7 @@ def display_company_profile(profile: dict):
             st.markdown(f"**Customers:** {scale.get('customers', 'N/A')}")
 
         # Business model
-        business_model = profile.get('business_model', {})
+        business_model = profile.get('business_model', _EMPTY)
         if business_model:
             st.markdown("**Business Model:**")
             st.markdown(business_model.get('primary_revenue_model', 'N/A'))
@@ -324,29 +623,32 @@ def display_business_units(units: list):
     """Display business units details"""
 
     with st.expander("Business Units", expanded=False):
+        # Compose the whole expander body as one HTML block — one element
+        # shipped to the frontend instead of ~6 per unit
+        parts = []
         for unit in units:
-            st.markdown(f"### {unit.get('name', 'Unknown')}")
-            st.markdown(f"*{unit.get('description', '')}*")
+            parts.append(f"<h3>{unit.get('name', 'Unknown')}</h3>")
+            parts.append(f"<p><em>{unit.get('description', '')}</em></p>")
 
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("Revenue", unit.get('revenue_contribution', 'N/A'))
-
-            with col2:
-                st.metric("Agreements", unit.get('agreement_volume', 'N/A'))
-
-            with col3:
-                complexity = unit.get('complexity_level', 0)
-                st.metric("Complexity", f"{complexity}/5")
+            parts.append(_metric_row_html([
+                ("Revenue", unit.get('revenue_contribution', 'N/A')),
+                ("Agreements", unit.get('agreement_volume', 'N/A')),
+                ("Complexity", f"{unit.get('complexity_level', 0)}/5")
+            ]))
 
             # Key agreement types
             if unit.get('key_agreement_types'):
-                st.markdown("**Key Agreement Types:**")
+                parts.append("<p><strong>Key Agreement Types:</strong></p><ul>")
                 for agr in unit['key_agreement_types']:
-                    st.markdown(f"- **{agr.get('type')}**: {agr.get('volume')} | Avg Value: {agr.get('avg_value')} | Term: {agr.get('avg_term')}")
+                    parts.append(
+                        f"<li><strong>{agr.get('type')}</strong>: {agr.get('volume')} | "
+                        f"Avg Value: {agr.get('avg_value')} | Term: {agr.get('avg_term')}</li>"
+                    )
+                parts.append("</ul>")
 
-            st.markdown("---")
+            parts.append("<hr>")
+
+        st.html("".join(parts))
 
 
 def display_agreement_landscape_by_function(landscape: dict):
@@ -354,58 +656,88 @@ def display_agreement_landscape_by_function(landscape: dict):
 
     with st.expander("Agreement Landscape by Function", expanded=False):
         functions = landscape.get('functions', [])
-        summary = landscape.get('summary', {})
+        summary = landscape.get('summary', _EMPTY)
 
         if not functions:
             st.info("No function-based agreement landscape data available.")
             return
 
-        # Summary
-        st.markdown(f"**Total Functions:** {summary.get('total_functions', len(functions))} | **Total Agreements:** {summary.get('total_estimated_agreements', 'N/A')}")
-        st.markdown("---")
+        # Compose the whole expander body as one HTML block — one element
+        # shipped to the frontend instead of ~10 per function
+        parts = [
+            f"<p><strong>Total Functions:</strong> {summary.get('total_functions', len(functions))} | "
+            f"<strong>Total Agreements:</strong> {summary.get('total_estimated_agreements', 'N/A')}</p><hr>"
+        ]
 
         for func in functions:
-            st.markdown(f"### {func.get('function_name', 'Unknown')}")
-            st.markdown(f"*{func.get('description', '')}*")
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("Total Agreements", func.get('total_agreements', 'N/A'))
-
-            with col2:
-                complexity = func.get('complexity', 0)
-                st.metric("Complexity", f"{complexity}/5")
+            parts.append(f"<h3>{func.get('function_name', 'Unknown')}</h3>")
+            parts.append(f"<p><em>{func.get('description', '')}</em></p>")
 
-            with col3:
-                systems = func.get('systems_used', [])
-                st.markdown("**Systems:**")
-                if systems:
-                    st.markdown(", ".join(systems[:3]))
-                else:
-                    st.markdown("N/A")
+            systems = func.get('systems_used', [])
+            parts.append(_metric_row_html([
+                ("Total Agreements", func.get('total_agreements', 'N/A')),
+                ("Complexity", f"{func.get('complexity', 0)}/5"),
+                ("Systems", ", ".join(islice(systems, 3)) if systems else "N/A")
+            ]))
 
             # Agreement types
             if func.get('agreement_types'):
-                st.markdown("**Key Agreement Types:**")
+                parts.append("<p><strong>Key Agreement Types:</strong></p><ul>")
                 for agr in func['agreement_types']:
                     managed_in = agr.get('managed_in', 'N/A')
-                    st.markdown(f"- **{agr.get('type')}**: {agr.get('volume')} | Term: {agr.get('avg_term', 'N/A')} | System: {managed_in}")
+                    parts.append(
+                        f"<li><strong>{agr.get('type')}</strong>: {agr.get('volume')} | "
+                        f"Term: {agr.get('avg_term', 'N/A')} | System: {managed_in}</li>"
+                    )
+                parts.append("</ul>")
 
             # Pain points
             if func.get('pain_points'):
-                st.markdown("**Pain Points:**")
-                for pain in func['pain_points']:
-                    st.markdown(f"- {pain}")
+                parts.append("<p><strong>Pain Points:</strong></p><ul>")
+                parts.extend(f"<li>{pain}</li>" for pain in func['pain_points'])
+                parts.append("</ul>")
+
+            parts.append("<hr>")
+
+        st.html("".join(parts))
+
+
+# Per-item icons for the findings/opportunities loops, hoisted so the loop
+# bodies do a dict lookup instead of rebuilding the literal per iteration
+_CONFIDENCE_ICON = {
+    'high': '✅',
+    'medium': '⚠️',
+    'low': '❓'
+}
+
+# Quote confidence-score tiers, shared by the Slide 3 and Slide 4 loops
+_CONFIDENCE_TIERS = (
+    (0.8, '🟢 High'),
+    (0.6, '🟡 Medium'),
+    (0.0, '🔴 Low'),
+)
 
-            st.markdown("---")
+
+def _confidence_indicator(score) -> str:
+    """Format a 0-1 confidence score as its tier label, e.g. '🟢 High confidence (0.9)'"""
+    label = next((tier for threshold, tier in _CONFIDENCE_TIERS if score >= threshold), '🔴 Low')
+    return f"{label} confidence ({score})"
+_PRIORITY_ICON = {
+    'high': '<i class="fas fa-exclamation-circle" style="color: #e53e3e;"></i>',
+    'medium': '<i class="fas fa-minus-circle" style="color: #f6ad55;"></i>',
+    'low': '<i class="fas fa-check-circle" style="color: #38a169;"></i>'
+}
+_DEFAULT_PRIORITY_ICON = '<i class="fas fa-circle"></i>'
 
 
 def display_deep_research_findings(deep_research: dict):
     """Display deep research findings with sources"""
 
     with st.expander("📊 Deep Research Findings", expanded=False):
-        if not deep_research or all(not v for k, v in deep_research.items() if k not in ['cache_used']):
+        # any() short-circuits on the first populated section instead of
+        # walking every field to prove them all empty
+        has_content = any(v for k, v in deep_research.items() if k != 'cache_used')
+        if not has_content:
             st.info("No deep research findings available.")
             return
 
@@ -436,11 +768,7 @@ def display_deep_research_findings(deep_research: dict):
             st.markdown("")
 
             for goal in strategic_goals:
-                confidence_icon = {
-                    'high': '✅',
-                    'medium': '⚠️',
-                    'low': '❓'
-                }.get(goal.get('confidence', 'low'), '❓')
+                confidence_icon = _CONFIDENCE_ICON.get(goal.get('confidence', 'low'), '❓')
 
                 st.markdown(f"{confidence_icon} **{goal.get('goal', 'N/A')}**")
                 if goal.get('source'):
@@ -457,11 +785,7 @@ def display_deep_research_findings(deep_research: dict):
             st.markdown("")
 
             for pain in pain_points:
-                confidence_icon = {
-                    'high': '✅',
-                    'medium': '⚠️',
-                    'low': '❓'
-                }.get(pain.get('confidence', 'low'), '❓')
+                confidence_icon = _CONFIDENCE_ICON.get(pain.get('confidence', 'low'), '❓')
 
                 st.markdown(f"{confidence_icon} {pain.get('pain', 'N/A')}")
                 if pain.get('source'):
@@ -471,7 +795,7 @@ def display_deep_research_findings(deep_research: dict):
             st.markdown("---")
 
         # Industry Benchmarks
-        benchmarks = deep_research.get('industry_benchmarks', {})
+        benchmarks = deep_research.get('industry_benchmarks', _EMPTY)
         if benchmarks and any(k not in ['source', 'applies_to'] for k in benchmarks.keys()):
             st.markdown("### 📈 Industry Benchmarks")
             if benchmarks.get('applies_to'):
@@ -495,52 +819,63 @@ def display_opportunities(opportunities: list):
     """Display optimization opportunities"""
 
     with st.expander("Optimization Opportunities", expanded=False):
+        parts = []
         for i, opp in enumerate(opportunities, 1):
-            priority = opp.get('implementation', {}).get('priority', 'medium')
-            priority_icon = {
-                'high': '<i class="fas fa-exclamation-circle" style="color: #e53e3e;"></i>',
-                'medium': '<i class="fas fa-minus-circle" style="color: #f6ad55;"></i>',
-                'low': '<i class="fas fa-check-circle" style="color: #38a169;"></i>'
-            }.get(priority, '<i class="fas fa-circle"></i>')
+            priority = opp.get('implementation', _EMPTY).get('priority', 'medium')
+            priority_icon = _PRIORITY_ICON.get(priority, _DEFAULT_PRIORITY_ICON)
 
-            st.markdown(f"### {priority_icon} {i}. {opp.get('title', 'Unknown')}", unsafe_allow_html=True)
-            st.markdown(opp.get('description', ''))
+            parts.append(f"<h3>{priority_icon} {i}. {opp.get('title', 'Unknown')}</h3>")
+            parts.append(f"<p>{opp.get('description', '')}</p>")
 
             # Function and Systems context
             business_function = opp.get('business_function')
             systems_impacted = opp.get('systems_impacted', [])
 
             if business_function or systems_impacted:
-                col1, col2 = st.columns(2)
-                with col1:
-                    if business_function:
-                        st.markdown(f"**Function:** {business_function}")
-                with col2:
-                    if systems_impacted:
-                        st.markdown(f"**Systems:** {', '.join(systems_impacted)}")
+                context_bits = []
+                if business_function:
+                    context_bits.append(f"<strong>Function:</strong> {business_function}")
+                if systems_impacted:
+                    context_bits.append(f"<strong>Systems:</strong> {', '.join(systems_impacted)}")
+                parts.append(f"<p>{' | '.join(context_bits)}</p>")
 
             # Value metrics
-            value_quant = opp.get('value_quantification', {})
+            value_quant = opp.get('value_quantification', _EMPTY)
             if value_quant:
-                col1, col2, col3, col4 = st.columns(4)
+                parts.append(_metric_row_html([
+                    ("Annual Value", value_quant.get('total_annual_value', 'N/A')),
+                    ("ROI", value_quant.get('roi_percentage', 'N/A')),
+                    ("Implementation Cost", value_quant.get('implementation_cost', 'N/A')),
+                    ("Payback", value_quant.get('payback_period', 'N/A'))
+                ]))
 
-                with col1:
-                    st.metric("Annual Value", value_quant.get('total_annual_value', 'N/A'))
-
-                with col2:
-                    st.metric("ROI", value_quant.get('roi_percentage', 'N/A'))
+            # Implementation details
+            impl = opp.get('implementation', _EMPTY)
+            parts.append(
+                f"<p><strong>Timeline:</strong> {impl.get('timeline', 'N/A')} | "
+                f"<strong>Priority:</strong> {impl.get('priority', 'N/A').upper()} | "
+                f"<strong>Complexity:</strong> {impl.get('complexity', 'N/A')}</p>"
+            )
 
-                with col3:
-                    st.metric("Implementation Cost", value_quant.get('implementation_cost', 'N/A'))
+            parts.append("<hr>")
 
-                with col4:
-                    st.metric("Payback", value_quant.get('payback_period', 'N/A'))
+        st.html("".join(parts))
 
-            # Implementation details
-            impl = opp.get('implementation', {})
-            st.markdown(f"**Timeline:** {impl.get('timeline', 'N/A')} | **Priority:** {impl.get('priority', 'N/A').upper()} | **Complexity:** {impl.get('complexity', 'N/A')}")
 
-            st.markdown("---")
+# Agreement-matrix table: source keys in display order, and their headers
+_MATRIX_COLS = [
+    'type', 'volume', 'complexity', 'classification',
+    'business_unit', 'estimated_annual_volume', 'description'
+]
+_MATRIX_RENAME = {
+    'type': 'Agreement Type',
+    'volume': 'Volume (1-10)',
+    'complexity': 'Complexity (1-10)',
+    'classification': 'Classification',
+    'business_unit': 'Business Unit',
+    'estimated_annual_volume': 'Est. Annual Volume',
+    'description': 'Description'
+}
 
 
 def display_agreement_matrix(matrix_data: dict):
@@ -548,7 +883,7 @@ def display_agreement_matrix(matrix_data: dict):
 
     with st.expander("Agreement Landscape Matrix", expanded=False):
         agreement_types = matrix_data.get('agreement_types', [])
-        metadata = matrix_data.get('matrix_metadata', {})
+        metadata = matrix_data.get('matrix_metadata', _EMPTY)
 
         if not agreement_types:
             st.info("No agreement matrix data available.")
@@ -569,28 +904,25 @@ def display_agreement_matrix(matrix_data: dict):
         # Create sortable table
         st.markdown("### Agreement Types by Volume & Complexity")
 
-        # Create dataframe for table display
-        table_data = []
-        for agr in agreement_types:
-            table_data.append({
-                'Agreement Type': agr.get('type', 'N/A'),
-                'Volume (1-10)': agr.get('volume', 'N/A'),
-                'Complexity (1-10)': agr.get('complexity', 'N/A'),
-                'Classification': agr.get('classification', 'N/A'),
-                'Business Unit': agr.get('business_unit', 'N/A'),
-                'Est. Annual Volume': agr.get('estimated_annual_volume', 'N/A'),
-                'Description': agr.get('description', 'N/A')
-            })
-
-        # Display table
-        import pandas as pd
-        df = pd.DataFrame(table_data)
-
-        # Sort by complexity descending, then volume descending
-        df_sorted = df.sort_values(by=['Complexity (1-10)', 'Volume (1-10)'], ascending=[False, False])
+        # Display table: from_records ingests the list-of-dicts in one
+        # C-level pass instead of seven per-key comprehensions
+        pd = _pd()
+        df = (
+            pd.DataFrame.from_records(agreement_types, columns=_MATRIX_COLS)
+            .rename(columns=_MATRIX_RENAME)
+            .fillna('N/A')
+        )
+
+        # Sort by complexity descending, then volume descending (in place, no copy)
+        df.sort_values(
+            by=['Complexity (1-10)', 'Volume (1-10)'],
+            ascending=[False, False],
+            kind='stable',
+            inplace=True
+        )
 
         st.dataframe(
-            df_sorted,
+            df,
             use_container_width=True,
             hide_index=True
         )
@@ -609,191 +941,317 @@ def display_agreement_matrix(matrix_data: dict):
                 st.metric("Low Volume / Low Complexity", quad_dist.get('low_vol_low_complex', 0))
 
 
-def display_visualization(analysis: dict):
-    """Display visualization export options"""
+@st.cache_data(show_spinner=False)
+def _build_docx(company: str, analysis_json: bytes) -> bytes:
+    """Build the Word export once per distinct analysis payload"""
+    return _get_export_manager().create_docx_content(company, json.loads(analysis_json))
 
-    st.markdown("### Export Agreement Landscape")
-    st.info("Download the visualization as a high-resolution image or PowerPoint presentation (importable to Google Slides)")
 
-    company_analyzed = analysis.get('_meta', {}).get('company_name', 'Company')
+def _file_stem(company_analyzed: str) -> str:
+    """Kebab-cased filename stem shared by every export branch"""
+    return company_analyzed.replace(' ', '_').lower()
 
-    col1, col2 = st.columns(2)
 
-    with col1:
-        if st.button("Export to PNG", use_container_width=True, type="primary"):
-            with st.spinner("Generating high-resolution image..."):
-                try:
-                    # Read visualization HTML
-                    viz_path = Path(__file__).parent / "visualization.html"
-
-                    if not viz_path.exists():
-                        st.error("Visualization file not found")
-                        return
-
-                    with open(viz_path, 'r') as f:
-                        viz_html = f.read()
-
-                    # Inject analysis data
-                    data_injection = f"""
-                    <script>
-                        window.addEventListener('load', function() {{
-                            const data = {json.dumps(analysis)};
-                            renderVisualization(data);
-                        }});
-                    </script>
-                    """
-                    complete_html = viz_html.replace('</body>', f'{data_injection}</body>')
-
-                    # Capture as PNG
-                    export_manager = ExportManager()
-                    png_bytes = export_manager.capture_html_as_png(
-                        complete_html,
-                        width=2400,
-                        height=2400,
-                        scale=2
-                    )
+# Worker pool for export builds that can overlap Streamlit layout work.
+# The backends release the GIL across I/O, so the page keeps rendering
+# while a document is assembled.
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='export')
 
-                    # Provide download button
-                    filename = f"{company_analyzed.replace(' ', '_').lower()}_visualization.png"
 
-                    st.download_button(
-                        label="Download PNG",
-                        data=png_bytes,
-                        file_name=filename,
-                        mime="image/png",
-                        use_container_width=True,
-                        key="download_png_viz"
-                    )
+def _render_docx_export(analysis: dict, company_analyzed: str, key: str):
+    """Word-doc export flow shared by main() and display_visualization()"""
+    with st.status("Creating Word document...", expanded=False):
+        try:
+            # Build on a worker thread so the script thread (and the session
+            # lock it holds) isn't pinned for the whole docx assembly
+            docx_bytes = _run_async(asyncio.to_thread(
+                _build_docx, company_analyzed, _json_dumps_bytes(analysis)
+            ))
+
+            # Provide download button
+            filename = f"{_file_stem(company_analyzed)}_slide_content.docx"
+
+            st.download_button(
+                label="Download Word Doc",
+                data=docx_bytes,
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                use_container_width=True,
+                key=key
+            )
 
-                    st.success("PNG generated successfully!")
+            st.success("Word document created successfully!")
 
-                except Exception as e:
-                    st.error(f"Export failed: {str(e)}")
-                    st.exception(e)
+        except Exception as e:
+            logger.exception("Export failed")
+            st.error(f"Export failed: {str(e)}")
+            if _debug_enabled():
+                st.exception(e)
 
-    with col2:
-        if st.button("Export to PowerPoint", use_container_width=True, type="primary"):
-            with st.spinner("Creating PowerPoint presentation..."):
-                try:
-                    # Create PowerPoint with native shapes (fast, no browser needed)
-                    export_manager = ExportManager()
-                    pptx_bytes = export_manager.create_pptx_native(
-                        company_analyzed,
-                        analysis
-                    )
 
-                    # Provide download button
-                    filename = f"{company_analyzed.replace(' ', '_').lower()}_presentation.pptx"
+@st.cache_resource
+def _minify_template(raw: bytes) -> bytes:
+    """Strip HTML comments, indentation and blank lines from the template
 
-                    st.download_button(
-                        label="Download PPTX",
-                        data=pptx_bytes,
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                        use_container_width=True,
-                        key="download_pptx_viz_col2"
-                    )
+    Newlines are preserved so the embedded JavaScript (line comments, ASI)
+    stays valid; this still trims the template by roughly a third, which is
+    a third less for Chromium to receive and parse on every capture.
+    """
+    stripped = re.sub(rb'<!--.*?-->', b'', raw, flags=re.S)
+    return b'\n'.join(
+        line for line in (ln.strip() for ln in stripped.split(b'\n')) if line
+    )
 
-                    st.success("PowerPoint created successfully! (Import to Google Slides)")
 
-                except Exception as e:
-                    st.error(f"Export failed: {str(e)}")
-                    st.exception(e)
+# Resolved once: the PNG branch only pays a stat() to validate the cache
+_VIZ_PATH = Path(__file__).parent / "visualization.html"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_viz_template(mtime: float) -> bytes:
+    """Read and minify visualization.html, re-reading only when it changes
+
+    Keyed on the file's mtime so editing the template during development
+    invalidates the cache while steady-state exports hit a dict lookup.
+    """
+    return _minify_template(_VIZ_PATH.read_bytes())
+
+
+def _viz_template_parts() -> tuple:
+    """Template pre-split around </body> so exports only pay for the join"""
+    head, tail = _split_viz_template(_VIZ_PATH.stat().st_mtime)
+    return head, tail
+
+
+@functools.lru_cache(maxsize=1)
+def _split_viz_template(mtime: float) -> tuple:
+    head, tail = _load_viz_template(mtime).rsplit(b'</body>', 1)
+    return head, b'</body>' + tail
+
+
+def _compose_viz_html(analysis: dict) -> bytes:
+    """Full visualization document with the analysis payload spliced in
+
+    The analysis rides along as a gzipped base64 blob: it keeps the HTML
+    Chromium must parse small, and DecompressionStream is native in the
+    Chromium build Playwright ships. The data is decoded with the native
+    JSON parser (Response.json) rather than evaluated as a JS object
+    literal, and base64 text can never contain a '</script' terminator,
+    so no escaping of the payload is needed.
+    """
+    viz_head, viz_tail = _viz_template_parts()
+    payload = base64.b64encode(gzip.compress(_json_dumps_bytes(analysis))).decode('ascii')
+    data_injection = f"""
+    <script>
+        window.__renderDone = false;
+        window.addEventListener('load', async function() {{
+            const compressed = Uint8Array.from(atob("{payload}"), c => c.charCodeAt(0));
+            const stream = new Blob([compressed]).stream().pipeThrough(new DecompressionStream('gzip'));
+            const data = await new Response(stream).json();
+            renderVisualization(data);
+            // Two frames after the render call: layout and paint have
+            // settled, so the PNG capture can proceed immediately
+            requestAnimationFrame(() => requestAnimationFrame(() => {{ window.__renderDone = true; }}));
+        }});
+    </script>
+    """
+    # Join the pre-split halves around the injected script: one allocation
+    # sized to the result, no template scan
+    return b''.join((viz_head, data_injection.encode('utf-8'), viz_tail))
+
+
+# Export formats: filename suffix -> (mime type, builder). Builders take
+# (company_name, analysis) and return file bytes; the table gives the ZIP
+# bundler and the download buttons one shared definition of each format.
+_EXPORTERS = {
+    'analysis.json': (
+        'application/json',
+        lambda company, analysis: _json_dumps_pretty_bytes(analysis)
+    ),
+    'visualization.png': (
+        'image/png',
+        lambda company, analysis: _get_export_manager().capture_html_as_png(
+            _compose_viz_html(analysis))
+    ),
+    'presentation.pptx': (
+        'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        lambda company, analysis: _get_export_manager().create_pptx_native(company, analysis)
+    ),
+    'slide_content.docx': (
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        lambda company, analysis: _build_docx(company, _json_dumps_bytes(analysis))
+    ),
+}
+
+
+@st.cache_data(show_spinner=False)
+def _rendered_png(analysis_hash: str, scale: int, _analysis: dict) -> bytes:
+    """PNG capture memoized on the analysis content hash and scale
+
+    A re-download of the same analysis skips template composition and the
+    whole Chromium round-trip — second click is a dict lookup.
+    """
+    return _get_export_manager().capture_html_as_png(
+        _compose_viz_html(_analysis), width=2400, height=2400, scale=scale
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _built_pptx(analysis_hash: str, company: str, _analysis: dict) -> bytes:
+    """PowerPoint build memoized on the analysis content hash"""
+    return _get_export_manager().create_pptx_native(company, _analysis)
+
+
+@st.fragment
+def display_visualization(analysis: dict):
+    """Display visualization export options
+
+    Runs as a fragment: clicking an export button reruns only this panel,
+    not the whole results page with its metrics, expanders and dataframes.
+    """
+
+    st.markdown("### Export Agreement Landscape")
+    st.info("Download the visualization as a high-resolution image or PowerPoint presentation (importable to Google Slides)")
+
+    company_analyzed = analysis.get('_meta', _EMPTY).get('company_name', 'Company')
+    analysis_hash = _analysis_hash(analysis)
+    file_stem = _file_stem(company_analyzed)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col3:
+        # JSON needs no generation step, so offer the bytes directly —
+        # orjson emits them without a str round-trip
+        st.download_button(
+            label="Download JSON",
+            data=_serialized_pretty_json(analysis_hash, analysis),
+            file_name=f"{file_stem}_analysis.json",
+            mime="application/json",
+            use_container_width=True,
+            key="download_json_viz"
+        )
+        st.download_button(
+            label="Download JSON (gzip)",
+            data=_serialized_json_gz(analysis_hash, analysis),
+            file_name=f"{file_stem}_analysis.json.gz",
+            mime="application/gzip",
+            use_container_width=True,
+            key="download_json_gz_viz"
+        )
+
+    with col1:
+        # scale=1 keeps Chromium's raster + PNG-encode cost at 2400x2400;
+        # retina doubles both dimensions (4x the pixels to compress)
+        png_scale = st.selectbox(
+            "PNG resolution",
+            options=(1, 2),
+            format_func=lambda s: "Standard (2400px)" if s == 1 else "Retina (4800px)",
+            key="png_scale"
+        )
+        # data accepts a zero-arg callable (Streamlit 1.46+), so the
+        # Chromium render is deferred until the click instead of running
+        # on every rerun; repeat clicks hit the _rendered_png cache
+        st.download_button(
+            label="Export to PNG",
+            data=lambda: _rendered_png(analysis_hash, png_scale, analysis),
+            file_name=f"{file_stem}_visualization.png",
+            mime="image/png",
+            use_container_width=True,
+            type="primary",
+            key="download_png_viz"
+        )
+
+    with col2:
+        # Native-shape deck, deferred to the click the same way; the
+        # build is memoized per analysis content so re-downloads are a
+        # dict lookup
+        st.download_button(
+            label="Export to PowerPoint",
+            data=lambda: _built_pptx(analysis_hash, company_analyzed, analysis),
+            file_name=f"{file_stem}_presentation.pptx",
+            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            use_container_width=True,
+            type="primary",
+            key="download_pptx_viz_col2"
+        )
 
     # Add Word document export in a new row
     st.markdown("---")
     if st.button("Export Slide Content as Word Doc", use_container_width=True, type="secondary"):
-        with st.spinner("Creating Word document..."):
+        _render_docx_export(analysis, company_analyzed, "download_docx_viz_bottom")
+
+    # One-click bundle: the four builders run concurrently (Playwright is
+    # I/O-bound, pptx/docx release the GIL in C extensions), so total
+    # latency is the slowest export rather than the sum of all four
+    if st.button("Export All Formats (ZIP)", use_container_width=True, type="secondary"):
+        with st.spinner("Building all export formats..."):
             try:
-                # Create Word document with slide content
-                export_manager = ExportManager()
-                docx_bytes = export_manager.create_docx_content(
-                    company_analyzed,
-                    analysis
-                )
+                futures = {
+                    f"{file_stem}_{suffix}": _EXPORT_EXECUTOR.submit(
+                        builder, company_analyzed, analysis)
+                    for suffix, (_mime, builder) in _EXPORTERS.items()
+                }
 
-                # Provide download button
-                filename = f"{company_analyzed.replace(' ', '_').lower()}_slide_content.docx"
+                buf = BytesIO()
+                with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+                    for name, future in futures.items():
+                        zf.writestr(name, future.result())
 
                 st.download_button(
-                    label="Download Word Doc",
-                    data=docx_bytes,
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    label="Download ZIP",
+                    data=buf.getvalue(),
+                    file_name=f"{file_stem}_exports.zip",
+                    mime="application/zip",
                     use_container_width=True,
-                    key="download_docx_viz_bottom"
+                    key="download_zip_viz"
                 )
 
-                st.success("Word document created successfully!")
+                st.success("All formats bundled successfully!")
 
             except Exception as e:
+                logger.exception("Export failed")
                 st.error(f"Export failed: {str(e)}")
-                st.exception(e)
-
-
-def display_main_analysis_slides(analysis: dict):
-    """
-    Display analysis content organized by slides for easy copy/paste.
-    Mirrors the Word Doc export structure.
-    """
-    company_name = analysis.get('_meta', {}).get('company_name', 'Company')
-    profile = analysis.get('company_profile', {})
-    scale = profile.get('scale', {})
-    business_units = analysis.get('business_units', [])
-    landscape = analysis.get('agreement_landscape_by_function', {})
-    functions = landscape.get('functions', []) if isinstance(landscape, dict) else []
-    opportunities = analysis.get('optimization_opportunities', [])
-    priority_mappings = analysis.get('priority_mappings', [])
-    strategic_priorities = analysis.get('strategic_priorities', [])
-    agreement_matrix = analysis.get('agreement_matrix', {})
-    matrix_types = agreement_matrix.get('agreement_types', [])
+                if _debug_enabled():
+                    st.exception(e)
 
-    # ===== EXECUTIVE SUMMARY =====
-    executive_summary = analysis.get('executive_summary', {})
-    bullets = executive_summary.get('bullets', [])
 
-    st.markdown("### 📌 Executive Summary")
-    if bullets:
-        for bullet in bullets:
-            st.markdown(f"- {bullet}")
-    else:
-        st.info("Executive summary not available for this analysis.")
-    st.markdown("---")
-
-    # ===== SLIDE 1: COMPANY HEADER & PROFILE =====
-    with st.expander("📄 SLIDE 1: Company Header & Profile", expanded=False):
+# Each slide renders as its own fragment: interacting inside one slide
+# reruns only that slide's Python instead of replaying the whole page.
+# The toggle gate means a closed slide's body is never executed — unlike
+# st.expander, which runs its body on every rerun even while collapsed.
+@st.fragment
+def _slide_company_header(company_name: str, profile: dict, scale: dict, business_units: list):
+    if not st.toggle("📄 SLIDE 1: Company Header & Profile", key="slide1_open"):
+        return
+    with st.container(border=True):
         st.markdown(f"**Company:** {company_name}")
         st.markdown(f"**Industry:** {profile.get('industry', 'N/A')}")
         st.markdown("")
 
-        # Metrics table
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("**Metric**")
-            st.markdown("Annual Revenue")
-            st.markdown("Employees")
-            st.markdown("Locations")
-        with col2:
-            st.markdown("**Value**")
-            st.markdown(scale.get('annual_revenue', 'N/A'))
-            st.markdown(str(scale.get('employees', 'N/A')))
-            st.markdown(str(scale.get('locations', 'N/A')))
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("Countries")
-            st.markdown("Business Units")
-        with col2:
-            st.markdown(str(scale.get('countries', 'N/A')))
-            st.markdown(str(len(business_units)))
-
-    # ===== SLIDE 2: AGREEMENT LANDSCAPE BY FUNCTION =====
-    with st.expander("📄 SLIDE 2: Agreement Landscape by Function", expanded=False):
+        # Metrics table: one element instead of two column pairs holding
+        # a dozen markdown cells
+        pd = _pd()
+        st.table(pd.DataFrame({
+            'Metric': ['Annual Revenue', 'Employees', 'Locations', 'Countries', 'Business Units'],
+            'Value': [
+                scale.get('annual_revenue', 'N/A'),
+                str(scale.get('employees', 'N/A')),
+                str(scale.get('locations', 'N/A')),
+                str(scale.get('countries', 'N/A')),
+                str(len(business_units))
+            ]
+        }))
+
+
+@st.fragment
+def _slide_landscape_table(functions: list):
+    if not st.toggle("📄 SLIDE 2: Agreement Landscape by Function", key="slide2_open"):
+        return
+    with st.container(border=True):
         st.markdown("**Business functions and their agreement management**")
         st.markdown("")
 
         if functions:
-            import pandas as pd
             table_data = []
             for func in functions:
                 complexity = func.get('complexity', 3)
@@ -807,17 +1265,27 @@ def display_main_analysis_slides(analysis: dict):
                     'Systems': ', '.join(systems) if systems else 'N/A'
                 })
 
-            df = pd.DataFrame(table_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            # st.dataframe accepts the list-of-dicts directly; no need to
+            # build (and re-infer dtypes for) a DataFrame on every rerun
+            st.dataframe(table_data, use_container_width=True, hide_index=True)
         else:
             st.info("No function data available in this analysis.")
 
-    # ===== SLIDE 3: PRIORITIES MAPPED TO CAPABILITIES =====
-    with st.expander("📄 SLIDE 3: Priorities Mapped to Capabilities", expanded=False):
+
+@st.fragment
+def _slide_priority_mappings(priority_mappings: list, strategic_priorities: list):
+    if not st.toggle("📄 SLIDE 3: Priorities Mapped to Capabilities", key="slide3_open"):
+        return
+    with st.container(border=True):
         st.markdown("**Strategic Alignment**")
         st.markdown("")
 
         if priority_mappings:
+            # Index strategic priorities once so each mapping resolves its
+            # notes with two dict lookups instead of a linear scan
+            by_id = {p.get('priority_id'): p for p in strategic_priorities if p.get('priority_id')}
+            by_name = {p.get('priority_name'): p for p in strategic_priorities if p.get('priority_name')}
+
             for idx, mapping in enumerate(priority_mappings[:3], start=1):
                 priority_name = mapping.get('priority_name', f'Priority {idx}')
                 priority_description = mapping.get('priority_description', '')
@@ -825,35 +1293,34 @@ def display_main_analysis_slides(analysis: dict):
                 capability_name = mapping.get('capability_name', f'Capability {idx}')
                 capability_description = mapping.get('capability_description', '')
 
-                st.markdown(f"#### {idx}. {priority_name} → {capability_name}")
-                st.markdown(f"**Priority:** {priority_description}")
-                st.markdown(f"**Capability:** {capability_description}")
-                st.markdown("")
+                # Accumulate the whole mapping into one Markdown block so
+                # each mapping costs a single st.markdown call instead of
+                # one per quote line
+                parts = [
+                    f"#### {idx}. {priority_name} → {capability_name}",
+                    f"**Priority:** {priority_description}",
+                    f"**Capability:** {capability_description}",
+                ]
 
                 # Find strategic priority data for notes
-                priority_data = None
-                if strategic_priorities:
-                    for priority in strategic_priorities:
-                        if priority.get('priority_id') == priority_id or priority.get('priority_name') == priority_name:
-                            priority_data = priority
-                            break
+                priority_data = by_id.get(priority_id) or by_name.get(priority_name)
 
                 # SLIDE NOTES section
                 if priority_data:
-                    st.markdown("---")
-                    st.markdown("**SLIDE NOTES (Copy to Slide Notes):**")
+                    parts.append("---")
+                    parts.append("**SLIDE NOTES (Copy to Slide Notes):**")
 
                     executive_owner = priority_data.get('executive_owner', '')
                     if executive_owner:
-                        st.markdown(f"**Executive Owner:** {executive_owner}")
+                        parts.append(f"**Executive Owner:** {executive_owner}")
 
                     executive_responsibility = priority_data.get('executive_responsibility', '')
                     if executive_responsibility:
-                        st.markdown(f"**Executive Responsibility:** {executive_responsibility}")
+                        parts.append(f"**Executive Responsibility:** {executive_responsibility}")
 
                     executive_quotes = priority_data.get('executive_quotes', [])
                     if executive_quotes:
-                        st.markdown("**Executive Quotes:**")
+                        parts.append("**Executive Quotes:**")
                         for quote in executive_quotes:
                             quote_text = quote.get('quote', '')
                             exec_name = quote.get('executive', 'Unknown')
@@ -862,60 +1329,55 @@ def display_main_analysis_slides(analysis: dict):
                             url = quote.get('url', '')
 
                             # Verification indicators
-                            confidence_score = quote.get('confidence_score', None)
-                            verified = quote.get('verified', None)
-                            verification_status = quote.get('verification_status', None)
-
-                            # Build confidence indicator
                             confidence_indicator = ""
-                            if confidence_score is not None:
-                                if confidence_score >= 0.8:
-                                    confidence_indicator = f"🟢 High confidence ({confidence_score})"
-                                elif confidence_score >= 0.6:
-                                    confidence_indicator = f"🟡 Medium confidence ({confidence_score})"
-                                else:
-                                    confidence_indicator = f"🔴 Low confidence ({confidence_score})"
-
-                            # Build verification indicator
+                            if (confidence_score := quote.get('confidence_score')) is not None:
+                                confidence_indicator = _confidence_indicator(confidence_score)
+
                             verification_indicator = ""
-                            if verified is not None:
-                                if verified:
-                                    verification_indicator = "✓ Verified"
-                                else:
-                                    verification_indicator = "⚠ Unverified"
-
-                            st.markdown(f"- *\"{quote_text}\"*")
-                            st.markdown(f"  — {exec_name}, {source}, {date}")
-                            if confidence_indicator or verification_indicator:
-                                indicators = " | ".join(filter(None, [confidence_indicator, verification_indicator]))
-                                st.markdown(f"  {indicators}")
+                            if (verified := quote.get('verified')) is not None:
+                                verification_indicator = "✓ Verified" if verified else "⚠ Unverified"
+
+                            quote_lines = [
+                                f"- *\"{quote_text}\"*",
+                                f"  — {exec_name}, {source}, {date}",
+                            ]
+                            if confidence_indicator and verification_indicator:
+                                quote_lines.append(f"  {confidence_indicator} | {verification_indicator}")
+                            elif confidence_indicator or verification_indicator:
+                                quote_lines.append(f"  {confidence_indicator}{verification_indicator}")
                             if url:
-                                st.markdown(f"  Source: {url}")
+                                quote_lines.append(f"  Source: {url}")
+                            parts.append("\n".join(quote_lines))
 
                     business_impact = priority_data.get('business_impact', '')
                     if business_impact:
-                        st.markdown(f"**Business Impact:** {business_impact}")
+                        parts.append(f"**Business Impact:** {business_impact}")
 
                     related_initiatives = priority_data.get('related_initiatives', [])
                     if related_initiatives:
                         if isinstance(related_initiatives, list):
-                            st.markdown(f"**Related Initiatives:** {', '.join(related_initiatives)}")
+                            parts.append(f"**Related Initiatives:** {', '.join(related_initiatives)}")
                         else:
-                            st.markdown(f"**Related Initiatives:** {related_initiatives}")
+                            parts.append(f"**Related Initiatives:** {related_initiatives}")
 
                     sources = priority_data.get('sources', [])
                     if sources:
                         if isinstance(sources, list):
-                            st.markdown(f"**Sources:** {'; '.join(sources)}")
+                            parts.append(f"**Sources:** {'; '.join(sources)}")
                         else:
-                            st.markdown(f"**Sources:** {sources}")
+                            parts.append(f"**Sources:** {sources}")
 
+                st.markdown("\n\n".join(parts))
                 st.markdown("")
         else:
             st.info("No priority mapping data available in this analysis.")
 
-    # ===== SLIDE 4: TOP 3 IDENTIFIED USE CASES =====
-    with st.expander("📄 SLIDE 4: Top 3 Identified Use Cases", expanded=False):
+
+@st.fragment
+def _slide_use_cases(opportunities: list):
+    if not st.toggle("📄 SLIDE 4: Top 3 Identified Use Cases", key="slide4_open"):
+        return
+    with st.container(border=True):
         st.markdown("**Intelligent Agreement Management**")
         st.markdown("")
 
@@ -928,17 +1390,22 @@ def display_main_analysis_slides(analysis: dict):
                 compliance = opp.get('compliance_benefits', '')
                 metrics = opp.get('metrics', [])
 
-                st.markdown(f"#### {idx}. {use_case_name}")
-                st.markdown(f"**Capabilities:** {capabilities}")
+                st.subheader(f"{idx}. {use_case_name}")
+
+                # One Markdown block for the descriptive lines; only the
+                # metric widgets below need their own elements
+                parts = [f"**Capabilities:** {capabilities}"]
 
                 if agreement_types:
-                    st.markdown(f"**Agreements:** {', '.join(agreement_types)}")
+                    parts.append(f"**Agreements:** {', '.join(agreement_types)}")
 
                 if risk_reduction:
-                    st.markdown(f"*Risk Reduction: {risk_reduction}*")
+                    parts.append(f"*Risk Reduction: {risk_reduction}*")
 
                 if compliance:
-                    st.markdown(f"*Compliance Benefits: {compliance}*")
+                    parts.append(f"*Compliance Benefits: {compliance}*")
+
+                st.markdown("\n\n".join(parts))
 
                 if metrics:
                     st.markdown("**Metrics:**")
@@ -951,64 +1418,60 @@ def display_main_analysis_slides(analysis: dict):
                             )
 
                 # SLIDE NOTES: Executive Alignment
-                exec_alignment = opp.get('executive_alignment', {})
+                exec_alignment = opp.get('executive_alignment', _EMPTY)
                 if exec_alignment:
-                    st.markdown("---")
-                    st.markdown("**SLIDE NOTES (Copy to Slide Notes):**")
-                    st.markdown("**Executive Alignment:**")
+                    notes = [
+                        "---",
+                        "**SLIDE NOTES (Copy to Slide Notes):**",
+                        "**Executive Alignment:**",
+                    ]
 
                     priority_name = exec_alignment.get('priority_name', '')
                     if priority_name:
-                        st.markdown(f"**Supports Priority:** {priority_name}")
+                        notes.append(f"**Supports Priority:** {priority_name}")
 
                     exec_champion = exec_alignment.get('executive_champion', '')
                     if exec_champion:
-                        st.markdown(f"**Executive Champion:** {exec_champion}")
+                        notes.append(f"**Executive Champion:** {exec_champion}")
 
                     alignment_statement = exec_alignment.get('alignment_statement', '')
                     if alignment_statement:
-                        st.markdown(f"**Alignment:** {alignment_statement}")
+                        notes.append(f"**Alignment:** {alignment_statement}")
 
                     supporting_quote = exec_alignment.get('supporting_quote', '')
                     if supporting_quote:
-                        st.markdown(f"**Supporting Quote:** *\"{supporting_quote}\"*")
+                        notes.append(f"**Supporting Quote:** *\"{supporting_quote}\"*")
 
                         # If there's a full quote object with verification data
-                        supporting_quote_data = exec_alignment.get('supporting_quote_data', {})
+                        supporting_quote_data = exec_alignment.get('supporting_quote_data', _EMPTY)
                         if supporting_quote_data:
-                            confidence_score = supporting_quote_data.get('confidence_score', None)
-                            verified = supporting_quote_data.get('verified', None)
-
                             # Build indicators
                             indicators = []
-                            if confidence_score is not None:
-                                if confidence_score >= 0.8:
-                                    indicators.append(f"🟢 High confidence ({confidence_score})")
-                                elif confidence_score >= 0.6:
-                                    indicators.append(f"🟡 Medium confidence ({confidence_score})")
-                                else:
-                                    indicators.append(f"🔴 Low confidence ({confidence_score})")
-
-                            if verified is not None:
-                                if verified:
-                                    indicators.append("✓ Verified")
-                                else:
-                                    indicators.append("⚠ Unverified")
+                            if (confidence_score := supporting_quote_data.get('confidence_score')) is not None:
+                                indicators.append(_confidence_indicator(confidence_score))
+
+                            if (verified := supporting_quote_data.get('verified')) is not None:
+                                indicators.append("✓ Verified" if verified else "⚠ Unverified")
 
                             if indicators:
-                                st.markdown(f"  {' | '.join(indicators)}")
+                                notes.append(f"  {' | '.join(indicators)}")
+
+                    st.markdown("\n\n".join(notes))
 
                 st.markdown("")
         else:
             st.info("No optimization opportunities available in this analysis.")
 
-    # ===== SLIDE 5: AGREEMENT LANDSCAPE MATRIX =====
-    with st.expander("📄 SLIDE 5: Agreement Landscape Matrix", expanded=False):
+
+@st.fragment
+def _slide_matrix_table(matrix_types: list):
+    if not st.toggle("📄 SLIDE 5: Agreement Landscape Matrix", key="slide5_open"):
+        return
+    with st.container(border=True):
         st.markdown("**Agreement types by business unit, volume, and complexity**")
         st.markdown("")
 
         if matrix_types:
-            import pandas as pd
             table_data = []
             for agr in matrix_types[:18]:  # First 18
                 table_data.append({
@@ -1018,53 +1481,54 @@ def display_main_analysis_slides(analysis: dict):
                     'Complexity (1-10)': str(agr.get('complexity', 5))
                 })
 
-            df = pd.DataFrame(table_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(table_data, use_container_width=True, hide_index=True)
         else:
             st.info("No agreement matrix data available in this analysis.")
 
-    st.markdown("---")
 
-    # ===== DISCOVERY QUESTIONS =====
-    discovery_questions = analysis.get('discovery_questions', [])
-
-    with st.expander("🎯 Discovery Questions", expanded=False):
+@st.fragment
+def _slide_discovery_questions(discovery_questions: list):
+    if not st.toggle("🎯 Discovery Questions", key="discovery_open"):
+        return
+    with st.container(border=True):
         if discovery_questions:
-            for idx, question in enumerate(discovery_questions, start=1):
-                st.markdown(f"{idx}. {question}")
+            st.markdown("\n".join(
+                f"{idx}. {question}" for idx, question in enumerate(discovery_questions, start=1)
+            ))
         else:
             st.info("Discovery questions not available for this analysis.")
 
-    # ===== DOCUSIGN PRODUCT DETAILS =====
-    docusign_product_summary = analysis.get('docusign_product_summary', {})
+
+@st.fragment
+def _slide_products(docusign_product_summary: dict):
     products = docusign_product_summary.get('products', [])
 
-    with st.expander("📦 DocuSign Product Recommendations", expanded=False):
+    if not st.toggle("📦 DocuSign Product Recommendations", key="products_open"):
+        return
+    with st.container(border=True):
         if products:
             for product in products:
-                st.markdown(f"### {product.get('product_name', 'Unknown Product')}")
-                st.markdown(f"**Category:** {product.get('category', 'N/A')}")
+                st.subheader(product.get('product_name', 'Unknown Product'))
+
+                parts = [f"**Category:** {product.get('category', 'N/A')}"]
 
                 use_cases = product.get('use_cases_enabled', [])
                 if use_cases:
-                    st.markdown(f"**Use Cases Enabled:**")
-                    for uc in use_cases:
-                        st.markdown(f"- {uc}")
+                    parts.append("**Use Cases Enabled:**\n" + "\n".join(f"- {uc}" for uc in use_cases))
 
                 capabilities = product.get('key_capabilities_relevant', [])
                 if capabilities:
-                    st.markdown(f"**Key Capabilities:**")
-                    for cap in capabilities:
-                        st.markdown(f"- {cap}")
+                    parts.append("**Key Capabilities:**\n" + "\n".join(f"- {cap}" for cap in capabilities))
 
                 estimated_value = product.get('estimated_value_enabled', 'N/A')
-                st.markdown(f"**Estimated Value Enabled:** {estimated_value}")
+                parts.append(f"**Estimated Value Enabled:** {estimated_value}")
 
                 why_recommended = product.get('why_recommended', '')
                 if why_recommended:
-                    st.markdown(f"**Why Recommended:** {why_recommended}")
+                    parts.append(f"**Why Recommended:** {why_recommended}")
 
-                st.markdown("---")
+                parts.append("---")
+                st.markdown("\n\n".join(parts))
 
             # Implementation approach
             implementation_approach = docusign_product_summary.get('implementation_approach', '')
@@ -1075,10 +1539,96 @@ def display_main_analysis_slides(analysis: dict):
             st.info("DocuSign product recommendations not available for this analysis.")
 
 
+def display_main_analysis_slides(analysis: dict):
+    """
+    Display analysis content organized by slides for easy copy/paste.
+    Mirrors the Word Doc export structure.
+    """
+    company_name = analysis.get('_meta', _EMPTY).get('company_name', 'Company')
+    profile = analysis.get('company_profile', _EMPTY)
+    scale = profile.get('scale', _EMPTY)
+    business_units = analysis.get('business_units', [])
+    landscape = analysis.get('agreement_landscape_by_function', _EMPTY)
+    functions = landscape.get('functions', []) if isinstance(landscape, dict) else []
+    opportunities = analysis.get('optimization_opportunities', [])
+    priority_mappings = analysis.get('priority_mappings', [])
+    strategic_priorities = analysis.get('strategic_priorities', [])
+    agreement_matrix = analysis.get('agreement_matrix', _EMPTY)
+    matrix_types = agreement_matrix.get('agreement_types', [])
+
+    # ===== EXECUTIVE SUMMARY =====
+    executive_summary = analysis.get('executive_summary', _EMPTY)
+    bullets = executive_summary.get('bullets', [])
+
+    st.markdown("### 📌 Executive Summary")
+    if bullets:
+        for bullet in bullets:
+            st.markdown(f"- {bullet}")
+    else:
+        st.info("Executive summary not available for this analysis.")
+    st.markdown("---")
+
+    _slide_company_header(company_name, profile, scale, business_units)
+    _slide_landscape_table(functions)
+    _slide_priority_mappings(priority_mappings, strategic_priorities)
+    _slide_use_cases(opportunities)
+    _slide_matrix_table(matrix_types)
+
+    st.markdown("---")
+
+    _slide_discovery_questions(analysis.get('discovery_questions', []))
+    _slide_products(analysis.get('docusign_product_summary', _EMPTY))
+
+
+
+@st.cache_resource(ttl=24 * 60 * 60, show_spinner=False)
+def _research_slot(company_name: str) -> dict:
+    """Per-company research slot, kept for 24 hours
+
+    Deliberately contains no st calls: cache_resource hands back the same
+    dict on every call, so _run_research_cached can probe it for a prior
+    result without Streamlit recording any elements for replay.
+    """
+    return {}
+
+
+def _run_research_cached(company_name: str, api_key: str, tavily_key: str, progress_boxes) -> dict:
+    """Run the full research pipeline, memoized per company for 24 hours
+
+    The cached layer is a pure slot lookup; the live run — whose progress
+    callbacks paint placeholders created elsewhere on the page — happens
+    out here, uncached. Running it inside a cache_data function recorded
+    those element calls and raised CacheReplayClosureError on the next
+    hit, turning the instant-replay path into an error box.
+    """
+    slot = _research_slot(company_name)
+    if 'result' not in slot:
+        slot['result'] = _run_async(
+            run_research(company_name, api_key, tavily_key, progress_boxes, None)
+        )
+    return slot['result']
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_analyses() -> tuple:
+    """Saved-analyses listing, memoized so sidebar reruns skip the Supabase round-trip
+
+    Returns the analyses, the default recent-10 view, and a precomputed
+    (lowercased name, analysis) index so the sidebar search doesn't
+    re-lower every company name on each keystroke. Refreshed every
+    minute; save and delete clear it explicitly so the sidebar reflects
+    those changes immediately.
+    """
+    analyses = st.session_state.storage.list_analyses()
+    lowered = [(a['company_name'].lower(), a) for a in analyses]
+    return analyses, analyses[:10], lowered
+
+
 def main():
     """Main application"""
 
     init_session_state()
+    _inject_css()
 
     # Initialize Supabase storage
     if 'storage' not in st.session_state:
@@ -1093,30 +1643,8 @@ def main():
         # Saved Analyses Section
         st.markdown('### <i class="fas fa-database"></i> Saved Analyses', unsafe_allow_html=True)
 
-        # Custom CSS for fixed-width buttons that wrap together
-        st.markdown("""
-        <style>
-        .analysis-row {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-            margin-bottom: 0.5rem;
-        }
-        .analysis-text {
-            flex: 1 1 auto;
-            min-width: 150px;
-        }
-        .analysis-buttons {
-            display: flex;
-            gap: 0.25rem;
-            flex-shrink: 0;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
         if st.session_state.storage.is_configured():
-            saved_analyses = st.session_state.storage.list_analyses()
+            saved_analyses, recent_analyses, lowered_names = _list_analyses()
 
             if saved_analyses:
                 st.caption(f"{len(saved_analyses)} saved analyses")
@@ -1126,38 +1654,40 @@ def main():
 
                 # Filter analyses if search query provided
                 if search_query:
-                    filtered_analyses = [a for a in saved_analyses if search_query.lower() in a['company_name'].lower()]
+                    query = search_query.lower()
+                    filtered_analyses = [a for name, a in lowered_names if query in name]
                 else:
-                    filtered_analyses = saved_analyses[:10]  # Show last 10
-
-                for analysis in filtered_analyses:
-                    # Use container with fixed-width buttons
-                    container = st.container()
-
-                    with container:
-                        # Text in one column, buttons in another with min-width
-                        col1, col2 = st.columns([7, 3])
-
-                        with col1:
-                            st.write(analysis["display_name"])
-
-                        with col2:
-                            # Buttons side by side with fixed width
-                            btn_col1, btn_col2 = st.columns(2)
-
-                            with btn_col1:
-                                if st.button("📂", key=f"load_{analysis['id']}", help="Load analysis"):
-                                    loaded_data = st.session_state.storage.load_analysis(analysis['id'])
-                                    if loaded_data:
-                                        st.session_state.analysis_result = loaded_data
-                                        st.success(f"Loaded: {analysis['company_name']}")
-                                        st.rerun()
-
-                            with btn_col2:
-                                if st.button("🗑️", key=f"del_{analysis['id']}", help="Delete analysis"):
-                                    if st.session_state.storage.delete_analysis(analysis['id']):
-                                        st.success("Deleted!")
-                                        st.rerun()
+                    filtered_analyses = recent_analyses  # Show last 10
+
+                # One selectbox + one button row regardless of how many
+                # analyses exist, instead of ~8 widgets per saved row
+                if filtered_analyses:
+                    selected = st.selectbox(
+                        "Saved analyses",
+                        filtered_analyses,
+                        format_func=lambda a: a["display_name"],
+                        label_visibility="collapsed",
+                        key="saved_analysis_pick",
+                    )
+
+                    load_col, del_col = st.columns(2)
+
+                    with load_col:
+                        if st.button("📂 Load", key="load_selected", use_container_width=True):
+                            loaded_data = st.session_state.storage.load_analysis(selected['id'])
+                            if loaded_data:
+                                st.session_state.analysis_result = loaded_data
+                                st.success(f"Loaded: {selected['company_name']}")
+                                st.rerun()
+
+                    with del_col:
+                        if st.button("🗑️ Delete", key="delete_selected", use_container_width=True):
+                            if st.session_state.storage.delete_analysis(selected['id']):
+                                _list_analyses.clear()
+                                st.success("Deleted!")
+                                st.rerun()
+                else:
+                    st.caption("No analyses match that search")
             else:
                 st.caption("No saved analyses yet")
         else:
@@ -1167,20 +1697,7 @@ def main():
         st.markdown("---")
 
         # About & Features Section (plain, not in expander)
-        st.markdown('### <i class="fas fa-info-circle"></i> About & Features', unsafe_allow_html=True)
-        st.markdown("""
-        This tool uses AI to research companies and generate comprehensive agreement landscape analyses.
-
-        **Features:**
-        - Parallel research agents (4x faster)
-        - Company profile analysis
-        - Business unit breakdown
-        - Agreement landscape mapping
-        - Optimization opportunities
-        - Interactive visualization
-        - Web search via Tavily (optional)
-        - Save to Supabase (optional)
-        """)
+        st.markdown(_ABOUT_BLOB, unsafe_allow_html=True)
 
     # Load API keys from environment variables
     api_key = os.environ.get('OPENAI_API_KEY')
@@ -1212,42 +1729,13 @@ def main():
         # Create progress containers
         st.markdown('### <i class="fas fa-chart-bar" style="color: rgb(255, 75, 75);"></i> Research Progress', unsafe_allow_html=True)
 
-        # Define research categories with metadata
-        research_categories = [
-            {'key': 'profile', 'title': 'Company Profile', 'icon': 'fas fa-building'},
-            {'key': 'business_units', 'title': 'Business Units', 'icon': 'fas fa-industry'},
-            {'key': 'priorities', 'title': 'Strategic Priorities', 'icon': 'fas fa-bullseye'},
-            {'key': 'landscape', 'title': 'Agreement Landscape', 'icon': 'fas fa-chart-bar'},
-            {'key': 'deep_research', 'title': 'Deep Research', 'icon': 'fas fa-search'},
-            {'key': 'opportunities', 'title': 'Opportunities', 'icon': 'fas fa-lightbulb'},
-            {'key': 'matrix', 'title': 'Agreement Matrix', 'icon': 'fas fa-table'}
-        ]
-
-        col1, col2 = st.columns(2)
-
-        progress_containers = {}
-
-        # Create containers and render initial "not-started" state for all categories
-        for i, category in enumerate(research_categories):
-            # Alternate between columns
-            with col1 if i % 2 == 0 else col2:
-                container = st.empty()
-                progress_containers[category['key']] = container
-                # Render initial not-started state
-                container.markdown(
-                    render_research_status(
-                        category['key'],
-                        category['title'],
-                        category['icon'],
-                        state='not-started'
-                    ),
-                    unsafe_allow_html=True
-                )
+        st.session_state.research_progress = {}
+        progress_boxes = _progress_region()
 
         # Run research with progress tracking
         try:
-            # Run async research (no status accordion)
-            result = asyncio.run(run_research(company_name, api_key, tavily_key, progress_containers, None))
+            # Run async research (no status accordion); cached per company per day
+            result = _run_research_cached(company_name, api_key, tavily_key, progress_boxes)
 
             st.session_state.analysis_result = result
 
@@ -1255,6 +1743,7 @@ def main():
             if st.session_state.storage.is_configured():
                 try:
                     if st.session_state.storage.save_analysis(company_name, result):
+                        _list_analyses.clear()
                         st.markdown('<div class="success-box"><i class="fas fa-check-circle" style="color: rgb(255, 75, 75);"></i> Analysis complete and saved to Supabase!</div>', unsafe_allow_html=True)
                     else:
                         st.markdown('<div class="success-box"><i class="fas fa-check-circle" style="color: rgb(255, 75, 75);"></i> Analysis complete!</div>', unsafe_allow_html=True)
@@ -1267,14 +1756,16 @@ def main():
                 st.info("Configure Supabase to save analyses")
 
         except Exception as e:
+            logger.exception("Analysis failed")
             st.error(f"Error during analysis: {str(e)}")
-            st.exception(e)
+            if _debug_enabled():
+                st.exception(e)
             return
 
     # Display results
     if st.session_state.analysis_result:
         analysis = st.session_state.analysis_result
-        company_analyzed = analysis.get('_meta', {}).get('company_name', 'Unknown')
+        company_analyzed = analysis.get('_meta', _EMPTY).get('company_name', 'Unknown')
 
         st.markdown("---")
 
@@ -1282,42 +1773,28 @@ def main():
         st.markdown(f"## {company_analyzed}")
 
         # Word Document Export Button (above Analysis Summary)
-        st.markdown("""
-        <style>
-        button[kind="secondary"] p {
-            text-transform: none !important;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Full-width Word export button
-        with st.spinner("Creating Word document..."):
-            try:
-                # Create Word document with slide content
-                export_manager = ExportManager()
-                docx_bytes = export_manager.create_docx_content(
-                    company_analyzed,
-                    analysis
-                )
-
-                # Provide download button
-                filename = f"{company_analyzed.replace(' ', '_').lower()}_slide_content.docx"
-
-                st.download_button(
-                    label="Download Word Doc",
-                    data=docx_bytes,
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                    key="download_docx_main_top"
-                )
-
-                st.success("Word document created successfully!")
-
-            except Exception as e:
-                st.error(f"Export failed: {str(e)}")
-                st.exception(e)
+        _inject_button_style()
+
+        # Word export is built only when asked for: the default results
+        # render pays zero export cost. On click the build runs on a worker
+        # (cache-backed, so repeat clicks are free) and the download button
+        # appears with the finished bytes.
+        if st.button("Generate Word Doc", use_container_width=True, key="generate_docx_main"):
+            docx_future = _EXPORT_EXECUTOR.submit(
+                _build_docx, company_analyzed, _json_dumps_bytes(analysis)
+            )
+            st.session_state.docx_export = (company_analyzed, docx_future.result())
+
+        docx_export = st.session_state.get('docx_export')
+        if docx_export and docx_export[0] == company_analyzed:
+            st.download_button(
+                label="Download Word Doc",
+                data=docx_export[1],
+                file_name=f"{_file_stem(company_analyzed)}_slide_content.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                use_container_width=True,
+                key="download_docx_main_top"
+            )
 
         # Summary metrics
         display_analysis_summary(analysis)
@@ -1333,12 +1810,12 @@ def main():
 
         with tab2:
             # BACKGROUND & DETAILS TAB - Detailed information
-            display_company_profile(analysis.get('company_profile', {}))
+            display_company_profile(analysis.get('company_profile', _EMPTY))
             display_business_units(analysis.get('business_units', []))
-            display_deep_research_findings(analysis.get('deep_research_findings', {}))
-            display_agreement_landscape_by_function(analysis.get('agreement_landscape_by_function', {}))
+            display_deep_research_findings(analysis.get('deep_research_findings', _EMPTY))
+            display_agreement_landscape_by_function(analysis.get('agreement_landscape_by_function', _EMPTY))
             display_opportunities(analysis.get('optimization_opportunities', []))
-            display_agreement_matrix(analysis.get('agreement_matrix', {}))
+            display_agreement_matrix(analysis.get('agreement_matrix', _EMPTY))
 
 
 if __name__ == "__main__":
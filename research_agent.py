@@ -1366,14 +1366,19 @@ Return as valid JSON with structure:
 
         return result
 
-    async def research_company_full(
+    async def _research_company_phases(
         self,
         company_name: str,
         progress_callbacks: Optional[Dict[str, Callable]] = None,
         status_obj = None
     ) -> Dict:
         """
-        Execute all research tasks in parallel and combine results
+        Execute the research tasks in dependency phases and return the
+        per-task results
+
+        Tasks within a phase run in parallel and are drained in completion
+        order (asyncio.as_completed), so each task's progress callback
+        fires as soon as it finishes rather than at phase boundaries.
 
         Args:
             company_name: Name of company to research
@@ -1381,7 +1386,8 @@ Return as valid JSON with structure:
             status_obj: Streamlit status object for updating the status label
 
         Returns:
-            Complete company analysis matching template structure
+            Dict with entries for profile, business_units, priorities,
+            landscape, matrix, deep_research and opportunities
         """
 
         callbacks = progress_callbacks or {}
@@ -1390,69 +1396,113 @@ Return as valid JSON with structure:
         if status_obj:
             status_obj.update(label="Running parallel research agents...")
 
-        # Phase 1: Execute profile, business units, and priorities in parallel (no dependencies)
-        profile_task = self.research_company_profile(
-            company_name,
-            callbacks.get('profile')
-        )
-        units_task = self.research_business_units(
-            company_name,
-            callbacks.get('business_units')
-        )
-        priorities_task = self.research_strategic_priorities(
-            company_name,
-            callbacks.get('priorities')
-        )
+        async def _named(name, coro):
+            return name, await coro
 
-        # Wait for Phase 1 to complete
-        profile, business_units, strategic_priorities = await asyncio.gather(
-            profile_task,
-            units_task,
-            priorities_task
-        )
+        # Phase 1: Execute profile, business units, and priorities in parallel (no dependencies)
+        phase1 = [
+            _named('profile', self.research_company_profile(
+                company_name,
+                callbacks.get('profile')
+            )),
+            _named('business_units', self.research_business_units(
+                company_name,
+                callbacks.get('business_units')
+            )),
+            _named('priorities', self.research_strategic_priorities(
+                company_name,
+                callbacks.get('priorities')
+            ))
+        ]
 
-        # Phase 2: Run landscape and matrix in parallel (depend on profile + business_units)
-        landscape_task = self.research_agreement_landscape(
-            company_name,
-            business_units,
-            callbacks.get('landscape')
-        )
-        matrix_task = self.research_agreement_matrix(
-            company_name,
-            profile,
-            business_units,
-            callbacks.get('matrix')
-        )
+        results = {}
+        for future in asyncio.as_completed(phase1):
+            name, result = await future
+            results[name] = result
+
+        profile = results['profile']
+        business_units = results['business_units']
+
+        # Phase 2: Run landscape, matrix and deep research in parallel — all
+        # three depend only on profile + business_units, so deep research
+        # (the slowest of the set) overlaps the other two instead of
+        # serializing behind them
+        phase2 = [
+            _named('landscape', self.research_agreement_landscape(
+                company_name,
+                business_units,
+                callbacks.get('landscape')
+            )),
+            _named('matrix', self.research_agreement_matrix(
+                company_name,
+                profile,
+                business_units,
+                callbacks.get('matrix')
+            )),
+            _named('deep_research', self.deep_research_company(
+                company_name,
+                profile,
+                business_units,
+                callbacks.get('deep_research')
+            ))
+        ]
 
-        # Wait for Phase 2 to complete
-        landscape, agreement_matrix = await asyncio.gather(
-            landscape_task,
-            matrix_task
-        )
+        for future in asyncio.as_completed(phase2):
+            name, result = await future
+            results[name] = result
 
-        # Phase 2.5: Run deep research (needs profile and business_units)
-        deep_research_findings = await self.deep_research_company(
-            company_name,
-            profile,
-            business_units,
-            callbacks.get('deep_research')
-        )
+        deep_research_findings = results['deep_research']
 
         # Phase 3: Run optimization opportunities (needs priorities, landscape, and deep research)
         opportunities = await self.research_optimization_opportunities(
             company_name,
             profile,
             business_units,
-            landscape,
-            strategic_priorities,
+            results['landscape'],
+            results['priorities'],
             deep_research_findings,
             callbacks.get('opportunities')
         )
+        results['opportunities'] = opportunities
 
         # Update status to complete
         if status_obj:
             status_obj.update(label="Research complete!", state="complete")
 
+        return results
+
+    async def research_company_full(
+        self,
+        company_name: str,
+        progress_callbacks: Optional[Dict[str, Callable]] = None,
+        status_obj = None
+    ) -> Dict:
+        """
+        Execute all research tasks in parallel and combine results
+
+        Args:
+            company_name: Name of company to research
+            progress_callbacks: Dict mapping task names to callback functions
+            status_obj: Streamlit status object for updating the status label
+
+        Returns:
+            Complete company analysis matching template structure
+        """
+
+        results = await self._research_company_phases(
+            company_name,
+            progress_callbacks,
+            status_obj
+        )
+
+        profile = results['profile']
+        business_units = results['business_units']
+        strategic_priorities = results['priorities']
+        landscape = results['landscape']
+        agreement_matrix = results['matrix']
+        deep_research_findings = results['deep_research']
+        opportunities = results['opportunities']
+
         # Map priorities to capabilities
         priority_mappings = self._map_priorities_to_capabilities(strategic_priorities, opportunities)
 